@@ -1,14 +1,16 @@
 import os
 import json
 import time
+import asyncio
 import hashlib
 import logging
 import traceback
 from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin
 
 import re
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from selectolax.parser import HTMLParser
 
 import discord
 from discord.ext import tasks, commands
@@ -30,6 +32,20 @@ HOUR_TICK_ROLE_ID   = int(os.getenv("HOUR_TICK_ROLE_ID", "0"))     # 정각 알
 FIELD_BOSS_ROLE_ID  = int(os.getenv("FIELD_BOSS_ROLE_ID", "0"))    # 필드보스
 ANNOUNCE_ROLE_ID    = int(os.getenv("ANNOUNCE_ROLE_ID", "0"))      # 공지다 멍!
 
+# 역할 멘션 문자열 (역할 ID 없으면 멘션 없이)
+HOUR_MENTION     = f"<@&{HOUR_TICK_ROLE_ID}>" if HOUR_TICK_ROLE_ID else ""
+BOSS_MENTION     = f"<@&{FIELD_BOSS_ROLE_ID}>" if FIELD_BOSS_ROLE_ID else ""
+ANNOUNCE_MENTION = f"<@&{ANNOUNCE_ROLE_ID}>" if ANNOUNCE_ROLE_ID else ""
+
+# 필드보스 등장 시각 (KST)
+FIELD_BOSS_HOURS = frozenset({12, 18, 20, 22})
+
+# JSON 직렬화 (orjson 없으면 표준 json으로 폴백)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 시간대 KST (tzdata 없을 때 폴백)
 try:
     from zoneinfo import ZoneInfo
@@ -42,7 +58,15 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 allowed = discord.AllowedMentions(everyone=False, users=False, roles=True)
-bot = commands.Bot(command_prefix="!", intents=intents, allowed_mentions=allowed)
+
+class NPCBot(commands.Bot):
+    async def close(self):
+        # 종료 시 공용 HTTP 세션도 같이 정리
+        if SESSION is not None and not SESSION.closed:
+            await SESSION.close()
+        await super().close()
+
+bot = NPCBot(command_prefix="!", intents=intents, allowed_mentions=allowed)
 
 def get_channel(cid: int):
     ch = bot.get_channel(cid)
@@ -52,40 +76,132 @@ def get_channel(cid: int):
     # send 메서드가 있으면 써도 됨(안전망)
     return ch if getattr(ch, "send", None) else None
 
+# on_ready/on_resumed에서 한 번 찾아두고 루프에서는 그대로 사용
+ALERT_CH = NOTICE_CH = LOG_CH = None
+
+def resolve_channels():
+    global ALERT_CH, NOTICE_CH, LOG_CH
+    ALERT_CH  = get_channel(ALERT_CHANNEL_ID)
+    NOTICE_CH = get_channel(NOTICE_CHANNEL_ID)
+    LOG_CH    = get_channel(LOG_CHANNEL_ID) if LOG_CHANNEL_ID else None
+    # 설정 실수는 첫 알림 때가 아니라 기동 시점에 바로 보이게
+    if not ALERT_CH:
+        logging.warning(f"ALERT_CHANNEL_ID({ALERT_CHANNEL_ID}) 채널을 찾을 수 없어요")
+    if not NOTICE_CH:
+        logging.warning(f"NOTICE_CHANNEL_ID({NOTICE_CHANNEL_ID}) 채널을 찾을 수 없어요")
+
+# 채널별 전송 간격 조절 (429 레이트리밋에 걸리기 전에 미리 천천히)
+SEND_INTERVAL = 0.25
+SEND_RETRIES  = 3
+_send_locks = {}
+_last_send  = {}
+
+async def paced_send(ch, *args, **kwargs):
+    lock = _send_locks.setdefault(ch.id, asyncio.Lock())
+    async with lock:
+        wait = SEND_INTERVAL - (time.monotonic() - _last_send.get(ch.id, 0.0))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        for attempt in range(SEND_RETRIES):
+            try:
+                return await ch.send(*args, **kwargs)
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == SEND_RETRIES - 1:
+                    raise
+                await asyncio.sleep(float(e.response.headers.get("Retry-After", 1)))
+            finally:
+                _last_send[ch.id] = time.monotonic()
+
 async def report_error(prefix: str, err: Exception):
     tb = "".join(traceback.format_exception(type(err), err, err.__traceback__))
     msg = f"❗ {prefix}\n```\n{tb[-1800:]}\n```"
-    ch = get_channel(LOG_CHANNEL_ID)
+    ch = LOG_CH
     if ch: await ch.send(msg)
     else: print(msg)
 
 # ---------------- 정각/필드보스 알림 ----------------
-@tasks.loop(minutes=1)
-async def tick_loop():
+_tick_task = None
+
+async def tick_alerts(now: datetime):
     try:
-        now = datetime.now(KST)
-        ch = get_channel(ALERT_CHANNEL_ID)
+        ch = ALERT_CH
         if not ch: return
 
+        hour = now.hour
+
         # 1) 정각 알림 (09:00 ~ 23:00)
-        if now.minute == 0 and 9 <= now.hour <= 23:
-            role = f"<@&{HOUR_TICK_ROLE_ID}>" if HOUR_TICK_ROLE_ID else ""
-            await ch.send(f"{role} ⏰ `{now:%m/%d (%a)}` **{now:%H:%M} 정각 알림!**")
+        if 9 <= hour <= 23:
+            await paced_send(ch, f"{HOUR_MENTION} ⏰ `{now:%m/%d (%a)}` **{now:%H:%M} 정각 알림!**")
 
         # 2) 필드보스 알림
-        if now.minute == 0 and now.hour in {12, 18, 20, 22}:
-            role = f"<@&{FIELD_BOSS_ROLE_ID}>" if FIELD_BOSS_ROLE_ID else ""
-            await ch.send(f"{role} 🐲 **필드보스 시간!** `{now:%H:%M}`")
+        if hour in FIELD_BOSS_HOURS:
+            await paced_send(ch, f"{BOSS_MENTION} 🐲 **필드보스 시간!** `{now:%H:%M}`")
 
     except Exception as e:
-        await report_error("tick_loop 에러", e)
+        await report_error("tick_alerts 에러", e)
+
+# 정각보다 이만큼 넘게 늦게 깨면(절전/VM 일시정지 등) 그 시각 알림은 건너뜀
+TICK_TOLERANCE = timedelta(minutes=1)
+
+async def tick_scheduler():
+    # 매 분 깨어나서 확인하는 대신 다음 정각까지 한 번에 잠듦
+    await bot.wait_until_ready()
+    last_fired = None
+    while not bot.is_closed():
+        now = datetime.now(KST)
+        nxt = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        await asyncio.sleep((nxt - now).total_seconds())
+
+        # sleep은 monotonic 시계 기준이라 실제 시각을 다시 확인
+        now = datetime.now(KST)
+        if now < nxt:
+            # 일찍 깼거나 시계가 뒤로 감 -> 다시 잠
+            continue
+        if nxt == last_fired:
+            # 같은 정각 중복 알림 방지
+            continue
+        last_fired = nxt
+        if now - nxt > TICK_TOLERANCE:
+            logging.warning(f"[tick] {nxt:%H:%M} 알림 건너뜀 ({now:%H:%M:%S}에 깨어남)")
+            continue
+        # 깨어난 시각이 몇 초 어긋나도 정각 기준으로 알림
+        await tick_alerts(nxt)
 
 # ---------------- 새 글 자동 알림 ----------------
-SESSION = requests.Session()
-SESSION.headers.update({
+# aiohttp 세션은 이벤트 루프 위에서 만들어야 해서 setup_hook에서 생성
+SESSION = None
+HTTP_HEADERS = {
     "User-Agent": "Mozilla/5.0 (DiscordBot; NPC Guild Helper)",
-    "Accept-Language": "ko-KR,ko;q=0.9"
-})
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Connection": "keep-alive",
+}
+
+# 일시적인 5xx는 짧게 재시도 (0.5s, 1s, 2s)
+HTTP_RETRY_TOTAL   = 3
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_RETRY_STATUS  = {502, 503, 504}
+# 재시도 포함 한 소스당 전체 제한 시간 (없으면 최악 10s x 4 + 백오프 ≈ 43s)
+HTTP_FETCH_DEADLINE = 20
+
+# 너무 빠른 연속 요청 방지: 동시에 최대 2개, 요청 끝나면 잠깐 쉬고 다음 차례
+FETCH_CONCURRENCY = 2
+FETCH_INTERVAL    = 0.5
+
+# 진짜 글 링크만: mabinogimobile.nexon.com/News/카테고리/숫자
+NEWS_RE = re.compile(r"mabinogimobile\.nexon\.com/News/(?:Notice|Update|Events|Devnote)/\d+")
+
+# 조건부 GET용 캐시: URL -> {"etag": ..., "lm": ...}
+CONDITIONAL = {}
+
+def create_http_session() -> aiohttp.ClientSession:
+    # 같은 호스트(mabinogimobile.nexon.com) 커넥션을 재사용
+    # 5분 주기 사이에도 keep-alive로 TLS 핸드셰이크 생략
+    connector = aiohttp.TCPConnector(limit=8, limit_per_host=4, keepalive_timeout=75)
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=HTTP_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
 
 NEWS_SOURCES = {
     # 이름: (URL, 태그용 이모지/라벨)
@@ -95,107 +211,248 @@ NEWS_SOURCES = {
     "에린노트": ("https://mabinogimobile.nexon.com/News/Devnote", "📔 에린노트"),
 }
 
+# 소스별로 최근 본 글 ID만 이만큼 유지 (페이지엔 최신 몇 개만 뜨므로 충분)
+SEEN_LIMIT = 200
+
+# 글 ID 해시 길이(바이트). hex로는 두 배 길이
+LINK_ID_SIZE = 12
+
 STATE_FILE = "seen.json"
-_bootstrap_done = False  # 첫 실행에 과거 글 폭탄 방지
+HTTP_CACHE_FILE = "http_cache.json"  # 조건부 GET 캐시(CONDITIONAL) 보관
+_bootstrapped = set()  # 첫 실행에 과거 글 폭탄 방지: 상태를 한 번 채운 소스 이름
+
+def read_json(path: str):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
+
+def write_json_atomic(path: str, data: dict):
+    # 임시 파일에 쓰고 교체 -> 도중에 죽어도 파일이 깨지지 않음
+    if orjson:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(raw)
+        # 교체 전에 디스크까지 내려써야 크래시 후 빈/깨진 파일이 안 남음
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 def load_state():
     if os.path.exists(STATE_FILE):
         try:
-            with open(STATE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return read_json(STATE_FILE)
         except Exception:
             pass
     return {k: [] for k in NEWS_SOURCES.keys()}
 
 def save_state(state: dict):
-    with open(STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
+    write_json_atomic(STATE_FILE, state)
+
+def load_http_cache():
+    # seen.json 없이 캐시만 살아있으면 304만 받다가 상태를 못 채우므로 같이 있을 때만 사용
+    if os.path.exists(HTTP_CACHE_FILE) and os.path.exists(STATE_FILE):
+        try:
+            return read_json(HTTP_CACHE_FILE)
+        except Exception:
+            pass
+    return {}
+
+def save_http_cache():
+    write_json_atomic(HTTP_CACHE_FILE, CONDITIONAL)
 
 def normalize_link(url: str) -> str:
     # 링크 자체를 해시로 ID화
-    h = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    # (중복 체크용 키라 암호학적 강도는 필요 없음 -> 빠른 blake2b)
+    h = hashlib.blake2b(url.encode("utf-8"), digest_size=LINK_ID_SIZE).hexdigest()
     return h
 
+def legacy_link_id(url: str) -> str:
+    # 예전 sha1 ID. seen.json에 남은 옛 ID도 "본 글"로 인정하기 위한 용도
+    # (옛 ID로 찾은 글은 새 ID도 같이 기록됨 -> 한 사이클 돌고 나면 제거 가능)
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
 
-def fetch_latest_items(name: str, url: str, limit: int = 20):
+
+async def http_get(url: str):
+    """
+    (본문 바이트, 새 ETag/Last-Modified)를 반환(인코딩은 파서가 <meta>로 판별).
+    페이지가 안 바뀌었으면(304) (None, None).
+    ETag/Last-Modified가 있으면 조건부 GET으로 요청함.
+    새 값은 CONDITIONAL에 바로 넣지 않음 -> 호출 쪽에서 처리가 끝난 뒤 저장.
+    """
+    headers = {}
+    cached = CONDITIONAL.get(url) or {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("lm"):
+        headers["If-Modified-Since"] = cached["lm"]
+
+    for attempt in range(HTTP_RETRY_TOTAL + 1):
+        last = attempt >= HTTP_RETRY_TOTAL
+        try:
+            async with SESSION.get(url, headers=headers) as r:
+                if r.status == 304:
+                    return None, None
+                if r.status not in HTTP_RETRY_STATUS or last:
+                    r.raise_for_status()
+                    body = await r.read()
+                    validators = {
+                        "etag": r.headers.get("ETag"),
+                        "lm": r.headers.get("Last-Modified"),
+                    }
+                    return body, validators
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last:
+                raise
+        await asyncio.sleep(HTTP_RETRY_BACKOFF * (2 ** attempt))
+
+async def fetch_latest_items(name: str, url: str, limit: int = 20):
     pass
     """
     글 상세로 이어지는 진짜 기사 링크만 수집:
     /News/(Notice|Update|Events|Devnote)/숫자
+    (글 목록, 새 ETag/Last-Modified)를 반환.
+    304면 (None, None), 실패면 ([], None)
     """
     try:
-        r = SESSION.get(url, timeout=10)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
+        html, validators = await asyncio.wait_for(http_get(url), HTTP_FETCH_DEADLINE)
+        if html is None:
+            # 304: 지난번과 같은 페이지라 파싱 생략
+            return None, None
+        tree = HTMLParser(html)
 
-        base = "https://mabinogimobile.nexon.com"
         items = []
         seen_href = set()
 
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip()
-            if href.startswith("/"):
-                href = base + href
+        for a in tree.css("a[href]"):
+            # /경로, //호스트, ?쿼리, 상대경로 모두 페이지 URL 기준 절대 URL로
+            href = urljoin(url, (a.attributes.get("href") or "").strip())
 
             # 진짜 글만: /News/카테고리/숫자
-            if not re.search(r"/News/(Notice|Update|Events|Devnote)/\d+", href):
+            if not NEWS_RE.search(href):
                 continue
 
             if href in seen_href:
                 continue
             seen_href.add(href)
 
-            title = a.get_text(strip=True) or "(제목 없음)"
+            title = a.text(strip=True) or "(제목 없음)"
             items.append({"id": normalize_link(href), "title": title, "link": href})
             if len(items) >= limit:
                 break
 
-        return items
+        return items, validators
     except Exception as e:
-        logging.warning(f"[news] {name} fetch 실패: {e}")
-        return []
+        logging.warning(f"[news] {name} fetch 실패: {e!r}")
+        return [], None
 
 async def announce_news_item(ch: discord.TextChannel, label: str, item: dict):
-    role = f"<@&{ANNOUNCE_ROLE_ID}>" if ANNOUNCE_ROLE_ID else ""
+    role = ANNOUNCE_MENTION
     title = item["title"]
     link  = item["link"]
     now   = datetime.now(KST).strftime("%m/%d %H:%M")
     msg = f"{role} {label} **새 글**\n🗓 `{now}`\n🔗 {link}\n**{title}**"
-    await ch.send(msg)
+    await paced_send(ch, msg)
 
 @tasks.loop(minutes=5)
 async def news_loop():
-    global _bootstrap_done
     try:
-        ch = get_channel(NOTICE_CHANNEL_ID)
+        ch = NOTICE_CH
         if not ch:
             return
 
         state = load_state()
-
-        for name, (url, label) in NEWS_SOURCES.items():
-            items = fetch_latest_items(name, url, limit=5)
-            if not items:
-                continue
-
-            known = set(state.get(name, []))
-            new_items = [it for it in items if it["id"] not in known]
-
-            # 첫 기동 직후엔 상태만 갱신하고 알림은 생략(폭탄 방지)
-            if not _bootstrap_done:
-                state[name] = list({*known, *[it["id"] for it in items]})
-                save_state(state)
-                continue
-
-            # 새 글이면 최신순으로 알림
-            for it in reversed(new_items):
-                await announce_news_item(ch, label, it)
-                known.add(it["id"])
-                state[name] = list(known)
+        validators = dict(CONDITIONAL)
+        # 새 글이 없으면 seen.json은 다시 쓸 필요 없음
+        dirty = False
+        # 이번 사이클에 상태가 맞춰진 소스 (사이클이 끝난 뒤 _bootstrapped에 반영)
+        seeded = set()
+
+        sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def guarded(name: str, url: str):
+            async with sem:
+                result = await fetch_latest_items(name, url, limit=5)
+                await asyncio.sleep(FETCH_INTERVAL)
+                return result
+
+        # 1단계: 소스들을 동시에 가져옴 (순차 RTT 합 -> 최대 RTT 수준)
+        results = await asyncio.gather(
+            *[guarded(n, u) for n, (u, _) in NEWS_SOURCES.items()],
+            return_exceptions=True,
+        )
+
+        # 2단계: 순서/레이트리밋 지키려고 알림은 소스 순서대로 하나씩
+        try:
+            for (name, (url, label)), result in zip(NEWS_SOURCES.items(), results):
+                if isinstance(result, BaseException):
+                    logging.warning(f"[news] {name} fetch 실패: {result!r}")
+                    continue
+                items, fresh = result
+                if items is None:
+                    # 304: 지난번 끝까지 처리한 페이지 그대로 -> 상태도 이미 맞음
+                    seeded.add(name)
+                    continue
+                # 실패했거나 200인데 글 링크가 하나도 없으면 페이지가 이상한 것
+                # -> 캐시 갱신도, 부트스트랩 완료 처리도 안 함
+                if not items:
+                    continue
+
+                # 부트스트랩은 소스별로: 글을 한 번이라도 제대로 받아 상태를 채운 소스만 알림
+                bootstrap = name not in _bootstrapped
+
+                # 오래된 것 -> 최신 순서로 쌓인 목록, 앞쪽부터 잘려나감
+                seen = list(state.get(name, []))
+                known = set(seen)
+                new_items = [
+                    it for it in items
+                    if it["id"] not in known and legacy_link_id(it["link"]) not in known
+                ]
+
+                # 페이지에 아직 떠 있는 글 ID는 목록 끝으로 옮겨서 잘려나가지 않게
+                # (예전 seen.json은 set으로 만든 목록이라 순서가 뒤섞여 있음)
+                on_page = []
+                for it in reversed(items):
+                    legacy = legacy_link_id(it["link"])
+                    if legacy in known:
+                        on_page.append(legacy)
+                    # 옛 ID로만 찾은 글도 새 ID를 같이 기록해서 이전을 한 번에 끝냄
+                    if it["id"] in known or legacy in known:
+                        on_page.append(it["id"])
+                pinned = set(on_page)
+                seen = [i for i in seen if i not in pinned] + on_page
+                if not pinned <= known:
+                    state[name] = seen[-SEEN_LIMIT:]
+                    dirty = True
+
+                # 첫 기동 직후엔 상태만 갱신하고 알림은 생략(폭탄 방지)
+                if bootstrap:
+                    seen.extend(it["id"] for it in reversed(new_items))
+                    state[name] = seen[-SEEN_LIMIT:]
+                    dirty = True
+                else:
+                    # 새 글이면 최신순으로 알림
+                    for it in reversed(new_items):
+                        await announce_news_item(ch, label, it)
+                        seen.append(it["id"])
+                        state[name] = seen[-SEEN_LIMIT:]
+                        dirty = True
+
+                # 이 소스를 끝까지 처리한 뒤에만 조건부 GET 캐시 갱신
+                # (중간에 실패하면 다음 사이클에 다시 전체를 받아 빠진 글을 알림)
+                if fresh is not None:
+                    CONDITIONAL[url] = fresh
+                seeded.add(name)
+        finally:
+            # 사이클 끝에 한 번만 기록 (알림 도중 에러가 나도 보낸 글은 남김)
+            if dirty:
                 save_state(state)
-
-            # 너무 빠른 연속 요청 방지
-            await bot.loop.run_in_executor(None, lambda: time.sleep(0.5))
+            # 상태가 디스크에 남은 소스부터 다음 사이클에 알림 시작
+            _bootstrapped.update(seeded)
+            if CONDITIONAL != validators:
+                save_http_cache()
 
     except Exception as e:
         await report_error("news_loop 에러", e)
@@ -238,8 +495,8 @@ async def 핑(ctx: commands.Context):
 
 @bot.command()
 async def 테스트공지(ctx):
-    ch = get_channel(NOTICE_CHANNEL_ID)
-    role = f"<@&{ANNOUNCE_ROLE_ID}>" if ANNOUNCE_ROLE_ID else ""
+    ch = NOTICE_CH
+    role = ANNOUNCE_MENTION
     now  = datetime.now(KST).strftime("%m/%d %H:%M")
     msg = f"{role} 📣 테스트 새 글 알림!\n🗓 `{now}`\n🔗 https://mabinogimobile.nexon.com/News/Notice\n**테스트용 공지입니다.**"
     if ch:
@@ -249,6 +506,9 @@ async def 테스트공지(ctx):
 
 @bot.event
 async def setup_hook():
+    global SESSION
+    SESSION = create_http_session()
+    CONDITIONAL.update(load_http_cache())
     # custom_id로 복원되므로 재부팅해도 버튼이 살아 있어요
     bot.add_view(SimpleAlertPanel())
 
@@ -265,21 +525,24 @@ async def 알림패널(ctx: commands.Context):
 @bot.event
 async def on_ready():
     print(f"✅ Logged in as {bot.user} (id={bot.user.id})")
-    if LOG_CHANNEL_ID:
-        log_ch = get_channel(LOG_CHANNEL_ID)
-        if log_ch:
-            await log_ch.send("🤖 봇이 온라인입니다. 스케줄러 시작!")
+    resolve_channels()
+    if LOG_CH:
+        await LOG_CH.send("🤖 봇이 온라인입니다. 스케줄러 시작!")
 
-    if not tick_loop.is_running():
-        tick_loop.start()
+    # on_ready는 재접속 때마다 불리므로 스케줄러는 하나만
+    global _tick_task
+    if _tick_task is None or _tick_task.done():
+        _tick_task = bot.loop.create_task(tick_scheduler())
 
     # news_loop는 첫 사이클은 부트스트랩(기존 글 상태만 기록)
-    global _bootstrap_done
-    _bootstrap_done = False
+    # 소스마다 글을 처음 제대로 받아온 사이클에 news_loop가 _bootstrapped에 넣음
     if not news_loop.is_running():
         news_loop.start()
-        # 첫 루프 한 번 지나가고 난 뒤부터 알림 시작
-        bot.loop.call_later(10, lambda: globals().__setitem__("_bootstrap_done", True))
+
+@bot.event
+async def on_resumed():
+    # 재연결 후 채널 객체가 바뀌었을 수 있어 다시 찾음
+    resolve_channels()
 
 if __name__ == "__main__":
     if not TOKEN: